@@ -8,14 +8,14 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import WebDriverException, TimeoutException
-from lib_resume_builder_AIHawk import Resume,StyleManager,FacadeManager,ResumeGenerator
-from src.utils import chromeBrowserOptions
-from src.gpt import GPTAnswerer
+from src.utils import chromeBrowserOptions, YAML_LOADER
 from src.linkedIn_authenticator import LinkedInAuthenticator
 from src.linkedIn_bot_facade import LinkedInBotFacade
 from src.linkedIn_job_manager import LinkedInJobManager
 from src.job_application_profile import JobApplicationProfile
 
+EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 # Suppress stderr
 sys.stderr = open(os.devnull, 'w')
 
@@ -25,13 +25,13 @@ class ConfigError(Exception):
 class ConfigValidator:
     @staticmethod
     def validate_email(email: str) -> bool:
-        return re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email) is not None
+        return EMAIL_REGEX.match(email) is not None
     
     @staticmethod
     def validate_yaml_file(yaml_path: Path) -> dict:
         try:
             with open(yaml_path, 'r') as stream:
-                return yaml.safe_load(stream)
+                return yaml.load(stream, Loader=YAML_LOADER)
         except yaml.YAMLError as exc:
             raise ConfigError(f"Error reading file {yaml_path}: {exc}")
         except FileNotFoundError:
@@ -159,6 +159,9 @@ def init_browser() -> webdriver.Chrome:
         raise RuntimeError(f"Failed to initialize browser: {str(e)}")
 
 def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_key: str):
+    # Deferred so that --help and configuration errors don't pay for loading langchain
+    from lib_resume_builder_AIHawk import Resume,StyleManager,FacadeManager,ResumeGenerator
+    from src.gpt import GPTAnswerer
     try:
         style_manager = StyleManager()
         resume_generator = ResumeGenerator()
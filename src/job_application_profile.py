@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Dict, List
 import yaml
+from src.utils import YAML_LOADER
 
 @dataclass
 class SelfIdentification:
@@ -48,7 +49,7 @@ class JobApplicationProfile:
 
     def __init__(self, yaml_str: str):
         try:
-            data = yaml.safe_load(yaml_str)
+            data = yaml.load(yaml_str, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
             raise ValueError("Error parsing YAML file.") from e
         except Exception as e:
@@ -1,4 +1,3 @@
-import time
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -18,7 +17,6 @@ class LinkedInAuthenticator:
     def start(self):
         print("Starting Chrome browser to log in to LinkedIn.")
         self.driver.get('https://www.linkedin.com')
-        self.wait_for_page_load()
         if not self.is_logged_in():
             self.handle_login()
 
@@ -33,8 +31,31 @@ class LinkedInAuthenticator:
             self.submit_login_form()
         except NoSuchElementException:
             print("Could not log in to LinkedIn. Please check your credentials.")
-        time.sleep(35) #TODO fix better
-        self.handle_security_check()
+        try:
+            WebDriverWait(self.driver, 40).until(
+                EC.any_of(
+                    EC.url_contains('https://www.linkedin.com/feed/'),
+                    EC.url_contains('https://www.linkedin.com/checkpoint/challengesV2/'),
+                    EC.visibility_of_element_located((By.ID, "error-for-username")),
+                    EC.visibility_of_element_located((By.ID, "error-for-password"))
+                )
+            )
+        except TimeoutException:
+            print("Login did not complete in time. Please try again later.")
+            return
+        if self.is_login_error_visible():
+            print("Login failed. Please check your credentials.")
+            return
+        if 'https://www.linkedin.com/feed/' in self.driver.current_url:
+            return
+        if 'https://www.linkedin.com/checkpoint/challengesV2/' in self.driver.current_url:
+            self.handle_security_check()
+            return
+        print("Login failed. Please check your credentials.")
+
+    def is_login_error_visible(self):
+        error_elements = self.driver.find_elements(By.ID, "error-for-username") + self.driver.find_elements(By.ID, "error-for-password")
+        return any(element.is_displayed() for element in error_elements)
 
     def enter_credentials(self):
         try:
@@ -68,23 +89,29 @@ class LinkedInAuthenticator:
             print("Security check not completed. Please try again later.")
 
     def is_logged_in(self):
-        self.driver.get('https://www.linkedin.com/feed')
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, 'share-box-feed-entry__trigger'))
-            )
-            buttons = self.driver.find_elements(By.CLASS_NAME, 'share-box-feed-entry__trigger')
-            if any(button.text.strip() == 'Start a post' for button in buttons):
-                print("User is already logged in.")
-                return True
-        except TimeoutException:
-            pass
+        # LinkedIn redirects the home page to the feed only for authenticated sessions
+        if 'https://www.linkedin.com/feed' not in self.driver.current_url:
+            return False
+        if not self.wait_for_page_load((By.CLASS_NAME, 'share-box-feed-entry__trigger')):
+            return False
+        buttons = self.driver.find_elements(By.CLASS_NAME, 'share-box-feed-entry__trigger')
+        if any(button.text.strip() == 'Start a post' for button in buttons):
+            print("User is already logged in.")
+            return True
         return False
 
-    def wait_for_page_load(self, timeout=10):
+    def wait_for_page_load(self, locator=None, timeout=10):
+        # With a locator, wait for that element only; otherwise fall back to document.readyState
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
-            )
+            if locator is not None:
+                WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_element_located(locator)
+                )
+            else:
+                WebDriverWait(self.driver, timeout).until(
+                    lambda d: d.execute_script('return document.readyState') == 'complete'
+                )
+            return True
         except TimeoutException:
             print("Page load timed out.")
+            return False
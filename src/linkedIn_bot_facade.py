@@ -1,21 +1,47 @@
+CREDENTIALS_SET = 1 << 0
+API_KEY_SET = 1 << 1
+JOB_APPLICATION_PROFILE_SET = 1 << 2
+GPT_ANSWERER_SET = 1 << 3
+PARAMETERS_SET = 1 << 4
+LOGGED_IN = 1 << 5
+
+STATE_NAMES = {
+    LOGGED_IN: "logged_in",
+    CREDENTIALS_SET: "credentials_set",
+    API_KEY_SET: "api_key_set",
+    JOB_APPLICATION_PROFILE_SET: "job_application_profile_set",
+    GPT_ANSWERER_SET: "gpt_answerer_set",
+    PARAMETERS_SET: "parameters_set",
+}
+
+LOGIN_REQUIREMENTS = CREDENTIALS_SET
+APPLY_REQUIREMENTS = LOGGED_IN | JOB_APPLICATION_PROFILE_SET | GPT_ANSWERER_SET | PARAMETERS_SET
+
 class LinkedInBotState:
+    __slots__ = ("_flags",)
+
     def __init__(self):
         self.reset()
 
     def reset(self):
-        self.credentials_set = False
-        self.api_key_set = False
-        self.job_application_profile_set = False
-        self.gpt_answerer_set = False
-        self.parameters_set = False
-        self.logged_in = False
-
-    def validate_state(self, required_keys):
-        for key in required_keys:
-            if not getattr(self, key):
-                raise ValueError(f"{key.replace('_', ' ').capitalize()} must be set before proceeding.")
+        self._flags = 0
+
+    def set(self, flag):
+        self._flags |= flag
+
+    def is_set(self, flag):
+        return self._flags & flag == flag
+
+    def validate_state(self, required_flags):
+        missing = required_flags & ~self._flags
+        if missing:
+            for flag, name in STATE_NAMES.items():
+                if missing & flag:
+                    raise ValueError(f"{name.replace('_', ' ').capitalize()} must be set before proceeding.")
 
 class LinkedInBotFacade:
+    __slots__ = ("login_component", "apply_component", "state", "job_application_profile", "resume", "email", "password", "parameters")
+
     def __init__(self, login_component, apply_component):
         self.login_component = login_component
         self.apply_component = apply_component
@@ -31,14 +57,14 @@ class LinkedInBotFacade:
         self._validate_non_empty(resume, "Resume")
         self.job_application_profile = job_application_profile
         self.resume = resume
-        self.state.job_application_profile_set = True
+        self.state.set(JOB_APPLICATION_PROFILE_SET)
 
     def set_secrets(self, email, password):
         self._validate_non_empty(email, "Email")
         self._validate_non_empty(password, "Password")
         self.email = email
         self.password = password
-        self.state.credentials_set = True
+        self.state.set(CREDENTIALS_SET)
 
     def set_gpt_answerer_and_resume_generator(self, gpt_answerer_component, resume_generator_manager):
         self._ensure_job_profile_and_resume_set()
@@ -46,22 +72,22 @@ class LinkedInBotFacade:
         gpt_answerer_component.set_resume(self.resume)
         self.apply_component.set_gpt_answerer(gpt_answerer_component)
         self.apply_component.set_resume_generator_manager(resume_generator_manager)
-        self.state.gpt_answerer_set = True
+        self.state.set(GPT_ANSWERER_SET)
 
     def set_parameters(self, parameters):
         self._validate_non_empty(parameters, "Parameters")
         self.parameters = parameters
         self.apply_component.set_parameters(parameters)
-        self.state.parameters_set = True
+        self.state.set(PARAMETERS_SET)
 
     def start_login(self):
-        self.state.validate_state(['credentials_set'])
+        self.state.validate_state(LOGIN_REQUIREMENTS)
         self.login_component.set_secrets(self.email, self.password)
         self.login_component.start()
-        self.state.logged_in = True
+        self.state.set(LOGGED_IN)
 
     def start_apply(self):
-        self.state.validate_state(['logged_in', 'job_application_profile_set', 'gpt_answerer_set', 'parameters_set'])
+        self.state.validate_state(APPLY_REQUIREMENTS)
         self.apply_component.start_applying()
 
     def _validate_non_empty(self, value, name):
@@ -69,5 +95,5 @@ class LinkedInBotFacade:
             raise ValueError(f"{name} cannot be empty.")
 
     def _ensure_job_profile_and_resume_set(self):
-        if not self.state.job_application_profile_set:
+        if not self.state.is_set(JOB_APPLICATION_PROFILE_SET):
             raise ValueError("Job application profile and resume must be set before proceeding.")
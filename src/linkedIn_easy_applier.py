@@ -19,6 +19,8 @@ from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver import ActionChains
 import src.utils as utils
 
+CONTROL_CHARS_REGEX = re.compile(r'[\x00-\x1F\x7F]')
+
 class LinkedInEasyApplier:
     def __init__(self, driver: Any, resume_dir: Optional[str], set_old_answers: List[Tuple[str, str, str]], gpt_answerer: Any, resume_generator_manager):
         if resume_dir is None or not os.path.exists(resume_dir):
@@ -250,8 +252,9 @@ class LinkedInEasyApplier:
             question_text = section.text.lower()
             options = [radio.text.lower() for radio in radios]
             existing_answer = None
+            sanitized_question = self._sanitize_text(question_text)
             for item in self.all_data:
-                if self._sanitize_text(question_text) in item['question'] and item['type'] == 'radio':
+                if item['type'] == 'radio' and sanitized_question in item['question']:
                     existing_answer = item
                     self._select_radio(radios, existing_answer['answer'])
                     return True
@@ -267,18 +270,18 @@ class LinkedInEasyApplier:
             text_field = text_fields[0]
             question_text = section.find_element(By.TAG_NAME, 'label').text.lower()
             is_numeric = self._is_numeric_field(text_field)
-            if is_numeric:
-                question_type = 'numeric'
-                answer = self.gpt_answerer.answer_question_numeric(question_text)
-            else:
-                question_type = 'textbox'
-                answer = self.gpt_answerer.answer_question_textual_wide_range(question_text)
+            question_type = 'numeric' if is_numeric else 'textbox'
             existing_answer = None
+            sanitized_question = self._sanitize_text(question_text)
             for item in self.all_data:
-                if 'cover' not in item['question'] and item['question'] == self._sanitize_text(question_text) and item['type'] == question_type:
+                if item['type'] == question_type and item['question'] == sanitized_question and 'cover' not in item['question']:
                     existing_answer = item
                     self._enter_text(text_field, existing_answer['answer'])
                     return True
+            if is_numeric:
+                answer = self.gpt_answerer.answer_question_numeric(question_text)
+            else:
+                answer = self.gpt_answerer.answer_question_textual_wide_range(question_text)
             self._save_questions_to_json({'type': question_type, 'question': question_text, 'answer': answer})
             self._enter_text(text_field, answer)
             return True
@@ -289,16 +292,17 @@ class LinkedInEasyApplier:
         if date_fields:
             date_field = date_fields[0]
             question_text = section.text.lower()
-            answer_date = self.gpt_answerer.answer_question_date()
-            answer_text = answer_date.strftime("%Y-%m-%d")
 
             existing_answer = None
+            sanitized_question = self._sanitize_text(question_text)
             for item in self.all_data:
-                if  self._sanitize_text(question_text) in item['question'] and item['type'] == 'date':
+                if item['type'] == 'date' and sanitized_question in item['question']:
                     existing_answer = item
                     self._enter_text(date_field, existing_answer['answer'])
                     return True
 
+            answer_date = self.gpt_answerer.answer_question_date()
+            answer_text = answer_date.strftime("%Y-%m-%d")
             self._save_questions_to_json({'type': 'date', 'question': question_text, 'answer': answer_text})
             self._enter_text(date_field, answer_text)
             return True
@@ -313,8 +317,9 @@ class LinkedInEasyApplier:
                 select = Select(dropdown)
                 options = [option.text for option in select.options]
                 existing_answer = None
+                sanitized_question = self._sanitize_text(question_text)
                 for item in self.all_data:
-                    if  self._sanitize_text(question_text) in item['question'] and item['type'] == 'dropdown':
+                    if item['type'] == 'dropdown' and sanitized_question in item['question']:
                         existing_answer = item
                         self._select_dropdown_option(dropdown, existing_answer['answer'])
                         return True
@@ -362,8 +367,8 @@ class LinkedInEasyApplier:
             except FileNotFoundError:
                 data = []
             data.append(question_data)
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=4)
+            utils.save_json_atomically(output_file, data)
+            self.all_data.append(question_data)
         except Exception:
             tb_str = traceback.format_exc()
             raise Exception(f"Error saving questions data to JSON file: \nTraceback:\n{tb_str}")
@@ -373,7 +378,7 @@ class LinkedInEasyApplier:
         sanitized_text = sanitized_text.strip()
         sanitized_text = sanitized_text.replace('"', '')
         sanitized_text = sanitized_text.replace('\\', '')
-        sanitized_text = re.sub(r'[\x00-\x1F\x7F]', '', sanitized_text)
+        sanitized_text = CONTROL_CHARS_REGEX.sub('', sanitized_text)
         sanitized_text = sanitized_text.replace('\n', ' ').replace('\r', '')
         sanitized_text = sanitized_text.rstrip(',')
         return sanitized_text
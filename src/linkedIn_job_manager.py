@@ -11,6 +11,8 @@ from src.job import Job
 from src.linkedIn_easy_applier import LinkedInEasyApplier
 import json
 
+JOBS_PER_PAGE = 25
+
 
 class EnvironmentKeys:
     def __init__(self):
@@ -32,12 +34,12 @@ class LinkedInJobManager:
         self.easy_applier_component = None
 
     def set_parameters(self, parameters):
-        self.company_blacklist = parameters.get('companyBlacklist', []) or []
-        self.title_blacklist = parameters.get('titleBlacklist', []) or []
+        self.company_blacklist = {company.strip().lower() for company in parameters.get('companyBlacklist', []) or []}
+        self.title_blacklist = set(parameters.get('titleBlacklist', []) or [])
         self.positions = parameters.get('positions', [])
         self.locations = parameters.get('locations', [])
         self.base_search_url = self.get_base_search_url(parameters)
-        self.seen_jobs = []
+        self.seen_jobs = set()
         resume_path = parameters.get('uploads', {}).get('resume', None)
         if resume_path is not None and Path(resume_path).exists():
             self.resume_path = Path(resume_path)
@@ -55,14 +57,14 @@ class LinkedInJobManager:
 
     def start_applying(self):
         self.easy_applier_component = LinkedInEasyApplier(self.driver, self.resume_path, self.set_old_answers, self.gpt_answerer, self.resume_generator_manager)
-        searches = list(product(self.positions, self.locations))
+        searches = list(dict.fromkeys(product(self.positions, self.locations)))
         random.shuffle(searches)
         page_sleep = 0
         minimum_time = 60 * 15
         minimum_page_time = time.time() + minimum_time
 
         for position, location in searches:
-            location_url = "&location=" + location
+            search_url = f"https://www.linkedin.com/jobs/search/{self.base_search_url}&keywords={position}&location={location}"
             job_page_number = -1
             utils.printyellow(f"Starting the search for {position} in {location}.")
 
@@ -71,11 +73,14 @@ class LinkedInJobManager:
                     page_sleep += 1
                     job_page_number += 1
                     utils.printyellow(f"Going to job page {job_page_number}")
-                    self.next_job_page(position, location_url, job_page_number)
+                    self.next_job_page(search_url, job_page_number)
                     time.sleep(random.uniform(1.5, 3.5))
                     utils.printyellow("Starting the application process for this page...")
-                    self.apply_jobs()
+                    jobs_on_page = self.apply_jobs()
                     utils.printyellow("Applying to jobs on this page has been completed!")
+                    if jobs_on_page < JOBS_PER_PAGE:
+                        utils.printyellow("This was the last page of results.")
+                        break
 
                     time_left = minimum_page_time - time.time()
                     if time_left > 0:
@@ -117,7 +122,11 @@ class LinkedInJobManager:
             raise Exception("No job class elements found on page")
         job_list = [Job(*self.extract_job_information_from_tile(job_element)) for job_element in job_list_elements] 
         for job in job_list:
-            if self.is_blacklisted(job.title, job.company, job.link):
+            if job.link in self.seen_jobs:
+                continue
+            if job.link:
+                self.seen_jobs.add(job.link)
+            if self.is_blacklisted(job.title, job.company):
                 utils.printyellow(f"Blacklisted {job.title} at {job.company}, skipping...")
                 self.write_to_file(job, "skipped")
                 continue
@@ -129,6 +138,7 @@ class LinkedInJobManager:
                 utils.printred(traceback.format_exc())
                 self.write_to_file(job, "failed")
                 continue
+        return len(job_list_elements)
         
     def write_to_file(self, job, file_name):
         pdf_path = Path(job.pdf_path).resolve()
@@ -142,19 +152,15 @@ class LinkedInJobManager:
             "pdf_path": pdf_path
         }
         file_path = self.output_file_directory / f"{file_name}.json"
-        if not file_path.exists():
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump([data], f, indent=4)
-        else:
-            with open(file_path, 'r+', encoding='utf-8') as f:
+        existing_data = []
+        if file_path.exists():
+            with open(file_path, 'r', encoding='utf-8') as f:
                 try:
                     existing_data = json.load(f)
                 except json.JSONDecodeError:
                     existing_data = []
-                existing_data.append(data)
-                f.seek(0)
-                json.dump(existing_data, f, indent=4)
-                f.truncate()
+        existing_data.append(data)
+        utils.save_json_atomically(file_path, existing_data)
 
     def get_base_search_url(self, parameters):
         url_parts = []
@@ -169,23 +175,25 @@ class LinkedInJobManager:
             url_parts.append(f"f_JT={','.join(job_types)}")
         date_mapping = {
             "all time": "",
-            "month": "&f_TPR=r2592000",
-            "week": "&f_TPR=r604800",
-            "24 hours": "&f_TPR=r86400"
+            "month": "f_TPR=r2592000",
+            "week": "f_TPR=r604800",
+            "24 hours": "f_TPR=r86400"
         }
         date_param = next((v for k, v in date_mapping.items() if parameters.get('date', {}).get(k)), "")
         url_parts.append("f_LF=f_AL")  # Easy Apply
-        base_url = "&".join(url_parts)
-        return f"?{base_url}{date_param}"
+        if date_param:
+            url_parts.append(date_param)
+        return f"?{'&'.join(url_parts)}"
     
-    def next_job_page(self, position, location, job_page):
-        self.driver.get(f"https://www.linkedin.com/jobs/search/{self.base_search_url}&keywords={position}{location}&start={job_page * 25}")
+    def next_job_page(self, search_url, job_page):
+        self.driver.get(f"{search_url}&start={job_page * JOBS_PER_PAGE}")
     
     def extract_job_information_from_tile(self, job_tile):
         job_title, company, job_location, apply_method, link = "", "", "", "", ""
         try:
-            job_title = job_tile.find_element(By.CLASS_NAME, 'job-card-list__title').text
-            link = job_tile.find_element(By.CLASS_NAME, 'job-card-list__title').get_attribute('href').split('?')[0]
+            title_element = job_tile.find_element(By.CLASS_NAME, 'job-card-list__title')
+            job_title = title_element.text
+            link = title_element.get_attribute('href').split('?', 1)[0]
             company = job_tile.find_element(By.CLASS_NAME, 'job-card-container__primary-description').text
         except:
             pass
@@ -200,9 +208,8 @@ class LinkedInJobManager:
 
         return job_title, company, job_location, link, apply_method
     
-    def is_blacklisted(self, job_title, company, link):
+    def is_blacklisted(self, job_title, company):
         job_title_words = job_title.lower().split(' ')
-        title_blacklisted = any(word in job_title_words for word in self.title_blacklist)
-        company_blacklisted = company.strip().lower() in (word.strip().lower() for word in self.company_blacklist)
-        link_seen = link in self.seen_jobs
-        return title_blacklisted or company_blacklisted or link_seen
+        title_blacklisted = not self.title_blacklist.isdisjoint(job_title_words)
+        company_blacklisted = company.strip().lower() in self.company_blacklist
+        return title_blacklisted or company_blacklisted
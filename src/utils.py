@@ -1,9 +1,14 @@
+import json
 import os
 import random
 import time
 
+import yaml
 from selenium import webdriver
 
+# Prefer the libyaml-backed C loader, falling back to the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 chromeProfilePath = os.path.join(os.getcwd(), "chrome_profile", "linkedin_profile")
 
 def ensure_chrome_profile():
@@ -14,6 +19,13 @@ def ensure_chrome_profile():
         os.makedirs(chromeProfilePath)
     return chromeProfilePath
 
+def save_json_atomically(file_path, data):
+    # Write to a sibling temp file and swap it in, so a crash never leaves a truncated file
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        json.dump(data, f, indent=4)
+    os.replace(tmp_path, file_path)
+
 def is_scrollable(element):
     scroll_height = element.get_attribute("scrollHeight")
     client_height = element.get_attribute("clientHeight")